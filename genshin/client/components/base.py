@@ -21,6 +21,8 @@ from genshin.client import routes
 from genshin.client.manager import managers
 from genshin.models import hoyolab as hoyolab_models
 from genshin.models import model as base_model
+from genshin.models.genshin import gacha as gacha_models
+from genshin.models.genshin import transaction as transaction_models
 from genshin.utility import concurrency, deprecation, ds
 
 __all__ = ["BaseClient"]
@@ -38,6 +40,11 @@ def parse_loose_headers(
     return multidict.CIMultiDict((str(k), str(v)) for k, v in dict(loose_headers or ()).items())
 
 
+def newest_first(item: typing.Union[gacha_models.BaseWish, transaction_models.BaseTransaction]) -> float:
+    """Sort key for merging histories which the api returns newest first."""
+    return -item.time.timestamp()
+
+
 class BaseClient(abc.ABC):
     """Base ABC Client."""
 
@@ -15,6 +15,10 @@ from genshin.utility import deprecation
 
 __all__ = ["WishClient"]
 
+# Genshin doesn't return timezone data
+# America: UTC-5, Europe: UTC+1, others are UTC+8
+_GENSHIN_TZ_OFFSETS = {"os_usa": -13, "os_euro": -7}
+
 
 class WishClient(base.BaseClient):
     """Wish component."""
@@ -68,10 +72,7 @@ class WishClient(base.BaseClient):
         )
 
         if game is types.Game.GENSHIN:
-            # Genshin doesn't return timezone data
-            # America: UTC-5, Europe: UTC+1, others are UTC+8
-            tz_offsets = {"os_usa": -13, "os_euro": -7}
-            tz_offset = tz_offsets.get(data["region"], 0)
+            tz_offset = _GENSHIN_TZ_OFFSETS.get(data["region"], 0)
         else:
             tz_offset = data["region_time_zone"]
             if game is types.Game.STARRAIL:
@@ -168,7 +169,7 @@ class WishClient(base.BaseClient):
         if len(iterators) == 1:
             return iterators[0]
 
-        return paginators.MergedPaginator(iterators, key=lambda wish: wish.time.timestamp())
+        return paginators.MergedPaginator(iterators, key=base.newest_first)
 
     def warp_history(
         self,
@@ -203,7 +204,7 @@ class WishClient(base.BaseClient):
         if len(iterators) == 1:
             return iterators[0]
 
-        return paginators.MergedPaginator(iterators, key=lambda wish: wish.time.timestamp())
+        return paginators.MergedPaginator(iterators, key=base.newest_first)
 
     def signal_history(
         self,
@@ -238,7 +239,7 @@ class WishClient(base.BaseClient):
         if len(iterators) == 1:
             return iterators[0]
 
-        return paginators.MergedPaginator(iterators, key=lambda wish: wish.time.timestamp())
+        return paginators.MergedPaginator(iterators, key=base.newest_first)
 
     @deprecation.deprecated("get_genshin_banner_names")
     async def get_banner_names(
@@ -11,6 +11,8 @@ from genshin.models.genshin import transaction as models
 
 __all__ = ["TransactionClient"]
 
+_TRANSACTION_ENDPOINTS = {kind: "Get" + kind.value.capitalize() + "Log" for kind in models.TransactionKind}
+
 
 class TransactionClient(base.BaseClient):
     """Transaction component."""
@@ -45,29 +47,23 @@ class TransactionClient(base.BaseClient):
     async def _get_transaction_page(
         self,
         end_id: int,
-        kind: str,
+        kind: models.TransactionKind,
         *,
         lang: typing.Optional[str] = None,
         authkey: typing.Optional[str] = None,
     ) -> typing.Sequence[models.BaseTransaction]:
         """Get a single page of transactions."""
-        kind = models.TransactionKind(kind)
-        endpoint = "Get" + kind.value.capitalize() + "Log"
-
         data = await self.request_transaction(
-            endpoint,
+            _TRANSACTION_ENDPOINTS[kind],
             lang=lang,
             authkey=authkey,
             params=dict(end_id=end_id, size=20),
         )
 
-        transactions: typing.List[models.BaseTransaction] = []
-        for trans in data["list"]:
-            model = models.ItemTransaction if "name" in trans else models.Transaction
-            model = typing.cast("typing.Type[models.BaseTransaction]", model)
-            transactions.append(model(**trans, kind=kind))
+        item_model, currency_model = models.ItemTransaction, models.Transaction
 
-        return transactions
+        # ids and datetimes come as strings so the models still have to be validated
+        return [(item_model if "name" in trans else currency_model)(**trans, kind=kind) for trans in data["list"]]
 
     def transaction_log(
         self,
@@ -90,7 +86,7 @@ class TransactionClient(base.BaseClient):
                 paginators.CursorPaginator(
                     functools.partial(
                         self._get_transaction_page,
-                        kind=kind,
+                        kind=models.TransactionKind(kind),
                         lang=lang,
                         authkey=authkey,
                     ),
@@ -102,4 +98,4 @@ class TransactionClient(base.BaseClient):
         if len(iterators) == 1:
             return iterators[0]
 
-        return paginators.MergedPaginator(iterators, key=lambda trans: trans.time.timestamp())
+        return paginators.MergedPaginator(iterators, key=base.newest_first)
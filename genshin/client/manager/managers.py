@@ -5,6 +5,7 @@ from __future__ import annotations
 import abc
 import functools
 import http.cookies
+import json
 import logging
 import typing
 import warnings
@@ -17,6 +18,13 @@ from genshin import errors, types
 from genshin.client import ratelimit
 from genshin.utility import fs as fs_utility
 
+try:
+    import orjson
+
+    _json_loads: typing.Callable[[bytes], typing.Any] = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 _LOGGER = logging.getLogger(__name__)
 
 __all__ = [
@@ -157,7 +165,8 @@ class BaseCookieManager(abc.ABC):
                     content = await response.text()
                     raise errors.GenshinException(msg="Recieved a response with an invalid content type:\n" + content)
 
-                data = await response.json()
+                # parse the raw body directly, orjson is used when installed
+                data = _json_loads(await response.read())
 
                 if not self.multi:
                     new_cookies = parse_cookie(response.cookies)
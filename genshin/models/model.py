@@ -26,16 +26,27 @@ class APIModel(pydantic.BaseModel, abc.ABC):
 
     _mi18n: typing.ClassVar[typing.Dict[str, typing.Dict[str, str]]] = {}
 
+    _timezones: typing.ClassVar[typing.Dict[str, datetime.timezone]] = {}
+    """Timezone of every field, resolved once per model class."""
+
+    def __init_subclass__(cls, **kwargs: typing.Any) -> None:
+        super().__init_subclass__(**kwargs)
+
+        cls._timezones = {}
+        for name, field in cls.__fields__.items():
+            timezone = field.field_info.extra.get("timezone", 0)
+            if not isinstance(timezone, datetime.timezone):
+                timezone = datetime.timezone(datetime.timedelta(hours=timezone))
+
+            cls._timezones[name] = timezone
+
     @pydantic.root_validator()
     def __parse_timezones(cls, values: typing.Dict[str, typing.Any]) -> typing.Dict[str, typing.Any]:
         """Timezones are a pain to deal with so we at least allow a plain hour offset."""
-        for name, field in cls.__fields__.items():
-            if isinstance(values.get(name), datetime.datetime) and values[name].tzinfo is None:
-                timezone = field.field_info.extra.get("timezone", 0)
-                if not isinstance(timezone, datetime.timezone):
-                    timezone = datetime.timezone(datetime.timedelta(hours=timezone))
-
-                values[name] = values[name].replace(tzinfo=timezone)
+        for name, timezone in cls._timezones.items():
+            value = values.get(name)
+            if isinstance(value, datetime.datetime) and value.tzinfo is None:
+                values[name] = value.replace(tzinfo=timezone)
 
         return values
 
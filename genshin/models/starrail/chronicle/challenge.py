@@ -1,6 +1,8 @@
 """Starrail chronicle challenge."""
 
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+import abc
+import array
+from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Protocol, Sequence
 
 if TYPE_CHECKING:
     import pydantic.v1 as pydantic
@@ -23,11 +25,13 @@ __all__ = [
     "ChallengeBuff",
     "FictionFloor",
     "FictionFloorNode",
+    "FloorCharacterColumns",
     "FloorNode",
     "StarRailAPCShadow",
     "StarRailChallenge",
     "StarRailChallengeSeason",
     "StarRailFloor",
+    "StarRailFloorChallenge",
     "StarRailPureFiction",
 ]
 
@@ -57,6 +61,45 @@ class StarRailFloor(StarRailChallengeFloor):
     node_2: FloorNode
 
 
+class FloorCharacterColumns(NamedTuple):
+    """Stats of characters used in challenge floors, one array per stat."""
+
+    ids: "array.array[int]"
+    levels: "array.array[int]"
+    ranks: "array.array[int]"
+    rarities: "array.array[int]"
+
+
+class _NodeFloor(Protocol):
+    @property
+    def node_1(self) -> FloorNode: ...
+
+    @property
+    def node_2(self) -> FloorNode: ...
+
+
+class StarRailFloorChallenge(abc.ABC):
+    """A challenge made of floors with two nodes each."""
+
+    floors: Sequence[_NodeFloor]
+
+    def get_character_columns(self) -> FloorCharacterColumns:
+        """Get the stats of every character used in all floors as columns.
+
+        Suited for aggregation, e.g. ``sum(columns.levels)``.
+        """
+        characters = [
+            character for floor in self.floors for node in (floor.node_1, floor.node_2) for character in node.avatars
+        ]
+
+        return FloorCharacterColumns(
+            ids=array.array("i", [character.id for character in characters]),
+            levels=array.array("i", [character.level for character in characters]),
+            ranks=array.array("i", [character.rank for character in characters]),
+            rarities=array.array("i", [character.rarity for character in characters]),
+        )
+
+
 class StarRailChallengeSeason(APIModel):
     """A season of a challenge."""
 
@@ -67,7 +110,7 @@ class StarRailChallengeSeason(APIModel):
     end_time: PartialTime
 
 
-class StarRailChallenge(APIModel):
+class StarRailChallenge(APIModel, StarRailFloorChallenge):
     """Memory of chaos challenge in a season."""
 
     name: str
@@ -122,7 +165,7 @@ class FictionFloor(StarRailChallengeFloor):
         return self.node_1.score + self.node_2.score
 
 
-class StarRailPureFiction(APIModel):
+class StarRailPureFiction(APIModel, StarRailFloorChallenge):
     """Pure Fiction challenge in a season."""
 
     name: str = pydantic.Field(deprecated="Use `season_id` together with `seasons instead`.")
@@ -194,7 +237,7 @@ class APCShadowSeason(StarRailChallengeSeason):
     lower_boss: APCShadowBoss
 
 
-class StarRailAPCShadow(APIModel):
+class StarRailAPCShadow(APIModel, StarRailFloorChallenge):
     """Apocalyptic shadow challenge in a season."""
 
     total_stars: int = Aliased("star_num")
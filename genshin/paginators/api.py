@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import abc
+import asyncio
 import typing
 import warnings
 
@@ -140,7 +141,7 @@ class TokenPaginator(typing.Generic[T], APIPaginator[T]):
 class CursorPaginator(typing.Generic[UniqueT], APIPaginator[UniqueT]):
     """Paginator based on end_id cursors."""
 
-    __slots__ = ("_page_size", "end_id")
+    __slots__ = ("_page_size", "end_id", "_prefetch", "_prefetched")
 
     getter: GetterCallback[UniqueT]
     """Underlying getter that yields the next page."""
@@ -151,6 +152,12 @@ class CursorPaginator(typing.Generic[UniqueT], APIPaginator[UniqueT]):
     end_id: typing.Optional[int]
     """Current end id. If none then exhausted."""
 
+    _prefetch: bool
+    """Whether the page after end_id should be requested while the current one is being consumed."""
+
+    _prefetched: typing.Optional[asyncio.Future[typing.Sequence[UniqueT]]]
+    """Request for the page after end_id running in the background."""
+
     def __init__(
         self,
         getter: GetterCallback[UniqueT],
@@ -164,21 +171,62 @@ class CursorPaginator(typing.Generic[UniqueT], APIPaginator[UniqueT]):
         self.end_id = end_id
 
         self._page_size = page_size
+        self._prefetch = False
+        self._prefetched = None
+
+    def _cancel_prefetch(self) -> None:
+        """Cancel the request for the next page if there is one."""
+        self._prefetch = False
+        if self._prefetched is not None:
+            self._prefetched.cancel()
+            self._prefetched = None
+
+    def _complete(self) -> typing.NoReturn:
+        self._cancel_prefetch()
+
+        super()._complete()
+        raise  # pyright bug
+
+    async def aclose(self) -> None:
+        """Stop the paginator early and cancel any requests running in the background."""
+        self._cancel_prefetch()
+        self._buffer = None
+        self.end_id = None
+
+    async def __anext__(self) -> UniqueT:
+        # only prefetch once more than a single item of the page is asked for,
+        # so that paginator.next() or breaking right away doesn't cost an extra request
+        if self._prefetch and self.end_id is not None:
+            self._prefetch = False
+            self._prefetched = base.background(self.getter(self.end_id))
+
+        return await super().__anext__()
 
     async def next_page(self) -> typing.Optional[typing.Iterable[UniqueT]]:
         """Get the next page of the paginator."""
         if self.end_id is None:
             return None
 
-        data = await self.getter(self.end_id)
+        if self._prefetched is not None:
+            # detached first so that a failed or cancelled prefetch is retried with a new request
+            prefetched, self._prefetched = self._prefetched, None
+            data = await prefetched
+        else:
+            data = await self.getter(self.end_id)
 
+        size = len(data)
         if self._page_size is None:
             warnings.warn("No page size specified for resource, having to guess.")
-            self._page_size = len(data)
+            self._page_size = size
 
-        if len(data) < self._page_size:
+        if size < self._page_size:
             self.end_id = None
             return data
 
         self.end_id = data[-1].id
+
+        # the cursor is known so the next request can overlap with consuming this page
+        limit = self.limit
+        self._prefetch = limit is None or self._counter + size <= limit
+
         return data
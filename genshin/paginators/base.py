@@ -27,6 +27,22 @@ async def aiterate(iterable: typing.Iterable[T]) -> typing.AsyncIterator[T]:
         yield i
 
 
+def _retrieve_exception(future: asyncio.Future[typing.Any]) -> None:
+    """Mark the exception of a finished future as retrieved."""
+    if not future.cancelled():
+        future.exception()
+
+
+def background(awaitable: typing.Awaitable[T]) -> asyncio.Future[T]:
+    """Run an awaitable in the background.
+
+    Its exception is not logged as never retrieved if nothing ends up awaiting it.
+    """
+    future = asyncio.ensure_future(awaitable)
+    future.add_done_callback(_retrieve_exception)
+    return future
+
+
 class Paginator(typing.Generic[T], abc.ABC):
     """Base paginator."""
 
@@ -83,6 +99,9 @@ class Paginator(typing.Generic[T], abc.ABC):
     def __aiter__(self) -> Paginator[T]:
         return self
 
+    async def aclose(self) -> None:
+        """Stop the paginator early and cancel any requests running in the background."""
+
     async def flatten(self) -> typing.Sequence[T]:
         """Flatten the paginator."""
         return [item async for item in self]
@@ -154,7 +173,7 @@ class BufferedPaginator(typing.Generic[T], Paginator[T], abc.ABC):
         if not self._buffer:
             self._complete()
 
-        if self.limit and self._counter >= self.limit:
+        if self.limit is not None and self._counter >= self.limit:
             self._complete()
 
         self._counter += 1
@@ -175,7 +194,7 @@ class BufferedPaginator(typing.Generic[T], Paginator[T], abc.ABC):
 class MergedPaginator(typing.Generic[T], Paginator[T]):
     """A paginator merging a collection of iterators."""
 
-    __slots__ = ("iterators", "_heap", "limit", "_key", "_prepared", "_counter")
+    __slots__ = ("iterators", "_heap", "limit", "_key", "_prepared", "_counter", "_refill")
 
     # TODO: Use named tuples for the heap
 
@@ -203,6 +222,13 @@ class MergedPaginator(typing.Generic[T], Paginator[T]):
     _counter: int
     """Amount of yielded items so far. No guarantee to be synchronized."""
 
+    _refill: typing.Optional[typing.Tuple[int, typing.AsyncIterator[T], typing.Optional[asyncio.Future[T]]]]
+    """Pending next value of the iterator whose value was yielded last.
+
+    (unique order id, iterator, future)
+    The future is None when the previous attempt failed and has to be requested again.
+    """
+
     def __init__(
         self,
         iterables: typing.Collection[typing.AsyncIterable[T]],
@@ -216,6 +242,7 @@ class MergedPaginator(typing.Generic[T], Paginator[T]):
 
         self._prepared = False
         self._counter = 0
+        self._refill = None
 
     def _complete(self) -> typing.NoReturn:
         """Mark paginator as complete and clear memory."""
@@ -256,36 +283,104 @@ class MergedPaginator(typing.Generic[T], Paginator[T]):
 
         self._prepared = True
 
+    async def _settle(self) -> None:
+        """Push the pending refill back into the heap queue."""
+        if self._refill is None:
+            return
+
+        order, it, future = self._refill
+        if future is None:
+            future = background(it.__anext__())
+            self._refill = (order, it, future)
+
+        # the refill stays stored until it finishes so that cancelling the caller
+        # doesn't cancel it as well and drop the rest of the iterator
+        try:
+            new_value = await asyncio.shield(future)
+        except StopAsyncIteration:
+            self._refill = None
+            return
+        except asyncio.CancelledError:
+            if future.cancelled():
+                self._refill = (order, it, None)
+
+            raise
+        except Exception:
+            self._refill = (order, it, None)
+            raise
+
+        self._refill = None
+        heapq.heappush(self._heap, self._create_heap_item(new_value, iterator=it, order=order))
+
     async def __anext__(self) -> T:
+        if self.limit is not None and self._counter >= self.limit:
+            self._complete()
+
         if not self._prepared:
             await self._prepare()
 
-        if not self._heap:
-            self._complete()
+        await self._settle()
 
-        if self.limit and self._counter >= self.limit:
+        if not self._heap:
             self._complete()
 
         self._counter += 1
 
-        _, order, value, it = self._heap[0]
-
-        try:
-            new_value = await it.__anext__()
-        except StopAsyncIteration:
-            heapq.heappop(self._heap)
-            return value
+        _, order, value, it = heapq.heappop(self._heap)
 
-        heapq.heapreplace(self._heap, self._create_heap_item(new_value, iterator=it, order=order))
+        # refilling the heap after the last item would only fetch values nobody asked for
+        if self.limit is None or self._counter < self.limit:
+            # the next value is fetched while the caller is consuming this one
+            self._refill = (order, it, background(it.__anext__()))
 
         return value
 
+    async def aclose(self) -> None:
+        """Stop the paginator early and cancel any requests running in the background."""
+        if self._refill is not None:
+            future = self._refill[2]
+            self._refill = None
+
+            if future is not None:
+                future.cancel()
+                await asyncio.wait([future])
+
+        for it in self.iterators:
+            aclose = getattr(it, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+        self._heap = []
+        self.iterators = []
+
     async def flatten(self, *, lazy: bool = False) -> typing.Sequence[T]:
         """Flatten the paginator."""
         if self.limit is not None and lazy:
             return [item async for item in self]
 
+        await self._settle()
+
         coros = (flatten(i) for i in self.iterators)
-        lists: typing.Sequence[typing.Sequence[T]] = await asyncio.gather(*coros)  # pyright: ignore
+        results = await asyncio.gather(*coros, return_exceptions=True)
+
+        # values already pulled into the heap have not been yielded yet
+        heads = {order: value for _, order, value, _ in self._heap} if self._prepared else {}
+
+        # a single list is filled, sorted and truncated in place to avoid intermediate copies
+        items: typing.List[T] = []
+        for order, value in enumerate(results):
+            if isinstance(value, BaseException):
+                raise value
+
+            if order in heads:
+                items.append(heads[order])
+
+            items.extend(value)
+
+        # timsort detects every list as a presorted run and merges them in C,
+        # stable like heapq.merge but without a python-level heap operation per item
+        items.sort(key=self._key)  # pyright: ignore
+        if self.limit is not None:
+            del items[self.limit - self._counter :]
 
-        return list(heapq.merge(*lists, key=self._key))[: self.limit]  # pyright: ignore
+        return items
@@ -18,11 +18,12 @@ setup(
     python_requires=">=3.8",
     install_requires=["aiohttp", "pydantic"],
     extras_require={
-        "all": ["browser-cookie3", "rsa", "click", "qrcode[pil]", "aiohttp-socks"],
+        "all": ["browser-cookie3", "rsa", "click", "qrcode[pil]", "aiohttp-socks", "orjson"],
         "cookies": ["browser-cookie3"],
         "auth": ["rsa", "qrcode[pil]"],
         "cli": ["click"],
         "socks-proxy": ["aiohttp-socks"],
+        "speedups": ["orjson"],
     },
     include_package_data=True,
     package_data={"genshin": ["py.typed"]},
@@ -103,6 +103,61 @@ def test_genshin_base_character_model(data: typing.Dict[str, typing.Any], expect
     assert genshin.models.BaseCharacter(**data) == expected
 
 
+def test_starrail_challenge_character_columns():
+    time = {"year": 2024, "month": 1, "day": 1, "hour": 4, "minute": 0}
+    first = {"id": 1001, "element": "ice", "rarity": 4, "icon": "", "level": 80, "rank": 6}
+    second = {"id": 1102, "element": "quantum", "rarity": 5, "icon": "", "level": 70, "rank": 0}
+    floor = {
+        "maze_id": 1,
+        "name": "Floor",
+        "star_num": 3,
+        "is_fast": False,
+        "round_num": 5,
+        "is_chaos": True,
+        "node_1": {"challenge_time": time, "avatars": [first, second]},
+        "node_2": {"challenge_time": time, "avatars": [second]},
+    }
+    challenge = genshin.models.StarRailChallenge(
+        schedule_id=1,
+        begin_time=time,
+        end_time=time,
+        star_num=3,
+        max_floor="Floor",
+        battle_num=1,
+        has_data=True,
+        all_floor_detail=[floor],
+        groups=[{"schedule_id": 1, "name_mi18n": "Season", "status": "", "begin_time": time, "end_time": time}],
+    )
+
+    columns = challenge.get_character_columns()
+    assert list(columns.ids) == [1001, 1102, 1102]
+    assert list(columns.levels) == [80, 70, 70]
+    assert list(columns.ranks) == [6, 0, 0]
+    assert list(columns.rarities) == [4, 5, 5]
+    assert sum(columns.levels) == 220
+
+    fiction = genshin.models.StarRailPureFiction(
+        season_id=1,
+        name="Season",
+        begin_time=time,
+        end_time=time,
+        star_num=3,
+        max_floor="Floor",
+        battle_num=1,
+        has_data=True,
+        max_floor_id=1,
+        all_floor_detail=[
+            {
+                **floor,
+                "node_1": {**floor["node_1"], "buff": None, "score": 20000},
+                "node_2": {**floor["node_2"], "buff": None, "score": 20000},
+            }
+        ],
+        groups=[],
+    )
+    assert list(fiction.get_character_columns().ids) == [1001, 1102, 1102]
+
+
 # reserialization stuff
 
 all_models: typing.Dict[typing.Type[genshin.models.APIModel], genshin.models.APIModel] = {}
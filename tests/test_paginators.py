@@ -1,8 +1,12 @@
+import asyncio
+import datetime
+import gc
 import typing
 
 import pytest
 
 from genshin import paginators
+from genshin.client.components.base import newest_first
 
 
 class CountingPaginator(paginators.Paginator[int]):
@@ -79,3 +83,273 @@ async def test_merged_paginator_with_key():
 
     paginator = paginators.MergedPaginator(iterators, key=len, limit=5)
     assert await paginator.flatten(lazy=True) == ["dog", "cat", "fish", "horse", "kangaroo"]
+
+
+async def test_cursor_paginator():
+    class Item(typing.NamedTuple):
+        id: int
+
+    requested: typing.List[int] = []
+
+    async def getter(end_id: int) -> typing.Sequence[Item]:
+        requested.append(end_id)
+        start = end_id or 12
+        return [Item(i) for i in range(start - 1, max(start - 6, 0), -1)]
+
+    paginator = paginators.CursorPaginator(getter, page_size=5)
+    assert [item.id async for item in paginator] == list(range(11, 0, -1))
+    assert requested == [0, 7, 2]
+
+    requested.clear()
+    paginator = paginators.CursorPaginator(getter, page_size=5, limit=5)
+    assert len(await paginator.flatten()) == 5
+    assert requested == [0]
+
+
+async def test_merged_paginator_key_computed_once():
+    sequences = [[1, 3, 5, 7], [0, 2, 4, 8], [5, 10, 15, 20]]
+    calls: typing.List[int] = []
+
+    def key(value: int) -> int:
+        calls.append(value)
+        return value
+
+    paginator = paginators.MergedPaginator([paginators.base.aiterate(x) for x in sequences], key=key)
+    assert await paginator.flatten() == sorted(sum(sequences, []))
+    assert sorted(calls) == sorted(sum(sequences, []))
+
+    calls.clear()
+    paginator = paginators.MergedPaginator([paginators.base.aiterate(x) for x in sequences], key=key)
+    assert [value async for value in paginator] == sorted(sum(sequences, []))
+    assert sorted(calls) == sorted(sum(sequences, []))
+
+
+async def test_merged_paginator_flatten_after_next():
+    sequences = [[1, 3, 5, 7], [0, 2, 4, 8], [5, 10, 15, 20], [], [25]]
+    iterators = [paginators.base.aiterate(x) for x in sequences]
+
+    paginator = paginators.MergedPaginator(iterators, limit=10)
+    assert await paginator.next() == 0
+    assert await paginator.next() == 1
+    assert await paginator.flatten() == [2, 3, 4, 5, 5, 7, 8, 10]
+
+
+async def test_merged_paginator_flatten_error():
+    async def failing() -> typing.AsyncIterator[int]:
+        raise RuntimeError("failed")
+        yield 0
+
+    paginator = paginators.MergedPaginator([paginators.base.aiterate([1, 2]), failing()])
+    with pytest.raises(RuntimeError):
+        await paginator.flatten()
+
+
+async def test_paginator_zero_limit():
+    class MockBufferedPaginator(paginators.BufferedPaginator[int]):
+        async def next_page(self) -> typing.Sequence[int]:
+            raise AssertionError("Fetched a page despite a zero limit")
+
+    assert await MockBufferedPaginator(limit=0).flatten() == []
+
+    iterators = [paginators.base.aiterate([1, 2]), paginators.base.aiterate([3])]
+    assert await paginators.MergedPaginator(iterators, limit=0).flatten(lazy=True) == []
+
+
+async def test_merged_paginator_lazy_limit_stops_fetching():
+    async def guarded(values: typing.Sequence[int]) -> typing.AsyncIterator[int]:
+        for value in values:
+            yield value
+
+        raise AssertionError("Fetched past the limit")
+
+    paginator = paginators.MergedPaginator([guarded([1, 3]), guarded([2, 4])], limit=3)
+    assert await paginator.flatten(lazy=True) == [1, 2, 3]
+
+
+async def test_merged_paginator_refills_in_background():
+    requested: typing.List[int] = []
+
+    async def source(values: typing.Sequence[int]) -> typing.AsyncIterator[int]:
+        for value in values:
+            requested.append(value)
+            yield value
+
+    paginator = paginators.MergedPaginator([source([1, 3]), source([2, 4])])
+    assert await paginator.next() == 1
+
+    await asyncio.sleep(0)
+    assert requested == [1, 2, 3]
+
+    assert await paginator.flatten() == [2, 3, 4]
+
+
+async def test_cursor_paginator_early_stop():
+    class Item(typing.NamedTuple):
+        id: int
+
+    requested: typing.List[int] = []
+
+    async def getter(end_id: int) -> typing.Sequence[Item]:
+        requested.append(end_id)
+        if end_id:
+            raise RuntimeError("Page failed")
+
+        return [Item(i) for i in range(10, 5, -1)]
+
+    errors: typing.List[typing.Any] = []
+    asyncio.get_running_loop().set_exception_handler(lambda loop, context: errors.append(context))
+
+    assert (await paginators.CursorPaginator(getter, page_size=5).next()).id == 10
+    async for _ in paginators.CursorPaginator(getter, page_size=5):
+        break
+
+    await asyncio.sleep(0)
+    assert requested == [0, 0]
+
+    # the prefetched page fails in the background without anyone awaiting it
+    requested.clear()
+    paginator = paginators.CursorPaginator(getter, page_size=5)
+    assert [(await paginator.next()).id for _ in range(2)] == [10, 9]
+    await asyncio.sleep(0)
+    assert requested == [0, 6]
+
+    del paginator
+    gc.collect()
+    assert errors == []
+
+    # closing cancels the prefetch before it runs
+    requested.clear()
+    paginator = paginators.CursorPaginator(getter, page_size=5)
+    assert [(await paginator.next()).id for _ in range(2)] == [10, 9]
+    await paginator.aclose()
+    await asyncio.sleep(0)
+    assert requested == [0]
+
+    with pytest.raises(StopAsyncIteration):
+        await paginator.__anext__()
+
+
+async def test_merged_paginator_early_stop():
+    class Item(typing.NamedTuple):
+        id: int
+
+    requested: typing.List[int] = []
+
+    def create_getter(start: int) -> typing.Callable[[int], typing.Awaitable[typing.Sequence[Item]]]:
+        async def getter(end_id: int) -> typing.Sequence[Item]:
+            requested.append(end_id)
+            return [Item(i) for i in range(end_id or start, (end_id or start) - 5, -1)]
+
+        return getter
+
+    paginator = paginators.MergedPaginator(
+        [paginators.CursorPaginator(create_getter(start), page_size=5) for start in (100, 200, 300)],
+        key=lambda item: -item.id,
+    )
+    assert (await paginator.next()).id == 300
+
+    # the refill has not started yet and every sub-paginator is closed with it
+    await paginator.aclose()
+    await asyncio.sleep(0)
+    assert requested == [0, 0, 0]
+
+    with pytest.raises(StopAsyncIteration):
+        await paginator.__anext__()
+
+
+async def test_merged_paginator_refill_error_not_logged():
+    async def failing() -> typing.AsyncIterator[int]:
+        yield 1
+        raise RuntimeError("Refill failed")
+
+    errors: typing.List[typing.Any] = []
+    asyncio.get_running_loop().set_exception_handler(lambda loop, context: errors.append(context))
+
+    paginator = paginators.MergedPaginator([failing(), paginators.base.aiterate([2])])
+    assert await paginator.next() == 1
+
+    await asyncio.sleep(0)
+    del paginator
+    gc.collect()
+    assert errors == []
+
+
+async def test_merged_paginator_newest_first():
+    class Item(typing.NamedTuple):
+        time: datetime.datetime
+
+    def history(*hours: int) -> typing.AsyncIterator[Item]:
+        times = [datetime.datetime(2024, 1, 1, hour, tzinfo=datetime.timezone.utc) for hour in hours]
+        return paginators.base.aiterate([Item(time) for time in times])
+
+    sequences = [(20, 9, 3), (23, 12, 4, 1), (), (15,)]
+    expected = [23, 20, 15, 12, 9, 4, 3, 1]
+
+    paginator = paginators.MergedPaginator([history(*x) for x in sequences], key=newest_first)
+    assert [item.time.hour for item in await paginator.flatten()] == expected
+
+    paginator = paginators.MergedPaginator([history(*x) for x in sequences], key=newest_first)
+    assert [item.time.hour async for item in paginator] == expected
+
+
+async def test_cursor_paginator_prefetch_retry():
+    class Item(typing.NamedTuple):
+        id: int
+
+    requested: typing.List[int] = []
+
+    async def getter(end_id: int) -> typing.Sequence[Item]:
+        requested.append(end_id)
+        if requested.count(end_id) == 1 and end_id:
+            raise RuntimeError("Page failed")
+
+        start = end_id or 12
+        return [Item(i) for i in range(start - 1, max(start - 6, 0), -1)]
+
+    paginator = paginators.CursorPaginator(getter, page_size=5)
+    assert [(await paginator.next()).id for _ in range(5)] == [11, 10, 9, 8, 7]
+
+    with pytest.raises(RuntimeError):
+        await paginator.next()
+
+    assert (await paginator.next()).id == 6
+    assert requested == [0, 7, 7]
+
+
+async def test_merged_paginator_cancelled_refill():
+    async def slow(values: typing.Sequence[int]) -> typing.AsyncIterator[int]:
+        for value in values:
+            if value == 3:
+                await asyncio.sleep(0.05)
+
+            yield value
+
+    paginator = paginators.MergedPaginator([slow([1, 3, 5]), paginators.base.aiterate([2, 4, 6])])
+    assert await paginator.next() == 1
+
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(paginator.next(), 0.01)
+
+    assert await paginator.flatten() == [2, 3, 4, 5, 6]
+
+
+async def test_merged_paginator_failed_refill_retried():
+    attempts: typing.List[int] = []
+
+    class Flaky(paginators.Paginator[int]):
+        async def __anext__(self) -> int:
+            attempts.append(len(attempts))
+            if len(attempts) == 2:
+                raise RuntimeError("Refill failed")
+            if len(attempts) > 3:
+                self._complete()
+
+            return len(attempts) * 2 - 1
+
+    paginator = paginators.MergedPaginator([Flaky(), paginators.base.aiterate([4])])
+    assert await paginator.next() == 1
+
+    with pytest.raises(RuntimeError):
+        await paginator.next()
+
+    assert await paginator.flatten() == [4, 5]